@@ -1,5 +1,5 @@
 # Export key symbols for convenience when importing from game package
-from .audio import init_mixer, load_sfx, load_music, play_move, start_ambient_loop, play, set_volume # noqa: F401
+from .audio import init_mixer, pre_init_mixer, close_mixer_until_needed, load_sfx, load_music, preload_async, play_move, start_ambient_loop, play, play_id, SFX, set_volume # noqa: F401
 from .save import load_progress, save_progress # noqa: F401
 from .levels import LEVELS, LevelInfo # noqa: F401
 from .star import StarHUD # noqa: F401
@@ -1,77 +1,220 @@
-"""game/audio.py – audio helper with a sound‑effect dictionary and volume control."""
+"""game/audio.py – audio helper with a sound‑effect dictionary and volume control.
+
+Short SFX (< ~500KB) are decoded into ``pygame.mixer.Sound`` objects; longer
+audio such as the ambient track is streamed through ``pygame.mixer.music``
+and must never be loaded as a Sound.
+"""
 
 import os
+import sys
+import threading
+import time
+from enum import IntEnum
+from functools import partial
+from typing import Callable, Optional
+
 import pygame
 
+# -----------------------------------------------------------------
+# Mixer buffer size (samples). Smaller = lower play() latency, larger =
+# fewer xruns under load. Override with AETHERIAL_AUDIO_BUFFER.
+# -----------------------------------------------------------------
+if sys.platform == "darwin":
+    _DEFAULT_BUFFER = 256
+elif sys.platform.startswith("linux"):
+    _DEFAULT_BUFFER = 1024
+else:
+    _DEFAULT_BUFFER = 512
+
+try:
+    _AUDIO_BUFFER = int(os.environ.get("AETHERIAL_AUDIO_BUFFER", _DEFAULT_BUFFER))
+except ValueError:
+    _AUDIO_BUFFER = _DEFAULT_BUFFER
+
+_MIXER_ARGS = dict(frequency=44100, size=-16, channels=2, buffer=_AUDIO_BUFFER)
+
 # -----------------------------------------------------------------
 # Initialise the mixer – must happen after pygame.init()
+# The mixer is brought up by the first load (load_sfx/load_music), so a
+# session that never loads audio never starts SDL's audio thread. Since
+# pygame.init() opens the mixer as well, the game closes it right after
+# with close_mixer_until_needed().
 # -----------------------------------------------------------------
+_mixer_ready = False
+
+def pre_init_mixer() -> None:
+    """Call *before* pygame.init() so it doesn't open the mixer with defaults."""
+    pygame.mixer.pre_init(**_MIXER_ARGS)
+
+def close_mixer_until_needed() -> None:
+    """Call right after pygame.init() to undo its eager mixer open."""
+    global _mixer_ready
+    pygame.mixer.quit()
+    _mixer_ready = False
+
 def init_mixer():
+    global _mixer_ready
+    if _mixer_ready:
+        return
     if not pygame.mixer.get_init():
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(**_MIXER_ARGS)
+    _mixer_ready = True
+
+# -----------------------------------------------------------------
+# Path-keyed Sound cache – the same file is only ever decoded once
+# -----------------------------------------------------------------
+_sound_cache: dict[str, pygame.mixer.Sound] = {}
+
+def _load_cached(path: str) -> pygame.mixer.Sound:
+    """Return the Sound for ``path``, decoding it only on the first request.
+
+    Keyed by the resolved real path so aliases/symlinks to the same file
+    share one decoded buffer.
+    """
+    p = os.path.realpath(path)
+    snd = _sound_cache.get(p)
+    if snd is None:
+        snd = pygame.mixer.Sound(p)
+        _sound_cache[p] = snd
+    return snd
+
+# -----------------------------------------------------------------
+# Candidate files per SFX key, tried in order (handles both WAV and MP3)
+# -----------------------------------------------------------------
+_AUDIO_DIR = os.path.join('assets', 'audio')
+
+_SOUND_FILES = {
+    "move": ["move.wav", "move.mp3"],
+    "place": ["place.mp3", "place.wav"],
+    "complete": ["complete.wav", "complete.mp3"],
+    "ui": ["ui_click.mp3", "ui_click.wav"],
+    "hover": ["hover.wav", "hover.mp3", "leaf_rustle.wav", "leaf_rustle.mp3"],  # Soft leaf rustle
+    "confirm": ["confirm.wav", "confirm.mp3", "chime.wav", "chime.mp3"]  # Magical chime
+}
+
+class SFX(IntEnum):
+    """Integer ids for the SFX keys – hot paths index a list instead of hashing a str."""
+    MOVE = 0
+    PLACE = 1
+    COMPLETE = 2
+    UI = 3
+    HOVER = 4
+    CONFIRM = 5
+
+_NAME_TO_ID = {sfx.name.lower(): sfx for sfx in SFX}
+
+# Joined once at import time instead of on every load attempt
+_CANDIDATES = {
+    key: tuple(os.path.join(_AUDIO_DIR, f) for f in filenames)
+    for key, filenames in _SOUND_FILES.items()
+}
+
+# Per-key level relative to the master volume
+_RELATIVE_MIX = {"ui": 0.5}
+
+# Last master volume applied by set_volume() (None → never set)
+_current_volume: float | None = None
 
 # -----------------------------------------------------------------
 # Load all SFX into a dictionary for easy lookup
 # -----------------------------------------------------------------
 def _load_sfx() -> dict[str, pygame.mixer.Sound]:
-    base = os.path.join('assets', 'audio')
     sounds = {}
-    
-    # Try different extensions for each sound file to handle both WAV and MP3
-    sound_files = {
-        "move": ["move.wav", "move.mp3"],
-        "place": ["place.mp3", "place.wav"],
-        "complete": ["complete.wav", "complete.mp3"],
-        "ui": ["ui_click.mp3", "ui_click.wav"],
-        "hover": ["hover.wav", "hover.mp3", "leaf_rustle.wav", "leaf_rustle.mp3"],  # Soft leaf rustle
-        "confirm": ["confirm.wav", "confirm.mp3", "chime.wav", "chime.mp3"]  # Magical chime
-    }
-    
-    for key, filenames in sound_files.items():
+
+    for key, paths in _CANDIDATES.items():
         sound = None
-        for filename in filenames:
+        for sound_path in paths:
+            # A stat is far cheaper than letting pygame raise on a missing file
+            if not os.path.isfile(sound_path):
+                continue
             try:
-                sound_path = os.path.join(base, filename)
-                sound = pygame.mixer.Sound(sound_path)
+                sound = _load_cached(sound_path)
                 break  # If successful, break out of the filename loop
-            except (pygame.error, FileNotFoundError):
-                continue  # Try next extension
-        
+            except pygame.error:
+                continue  # Unreadable file – try the next candidate
+
         if sound:
             sounds[key] = sound
         else:
             print(f"Warning: Could not load sound file for '{key}'")
-    
+
     # UI clicks are a little softer by default
     if "ui" in sounds:
-        sounds["ui"].set_volume(0.5)
+        sounds["ui"].set_volume(_RELATIVE_MIX["ui"])
+
     return sounds
 
 _sounds: dict[str, pygame.mixer.Sound] = {}
+# Bound play callables indexed by SFX id, built once per load
+_play_list: list[Optional[Callable[..., object]]] = [None] * len(SFX)
+
+# -----------------------------------------------------------------
+# Dedicated channel per SFX key – play() never has to search for a free
+# voice, and a retriggered key (e.g. rapid hovers) simply restarts on its
+# own channel instead of stealing others. That bounds SFX to one live
+# voice per key; the total is capped at 8 (6 reserved + 2 spare) so
+# SDL's per-voice mixing state can't grow during long sessions.
+# -----------------------------------------------------------------
+_NUM_CHANNELS = 8
+_channels: list[pygame.mixer.Channel] = []
+
+def _reserve_channels() -> None:
+    global _channels
+    pygame.mixer.set_num_channels(_NUM_CHANNELS)
+    pygame.mixer.set_reserved(len(SFX))
+    _channels = [pygame.mixer.Channel(sfx) for sfx in SFX]
 
 def load_sfx():
-    """Public wrapper – call after `init_mixer()`."""
-    global _sounds
-    _sounds = _load_sfx()
+    """Public wrapper – initialises the mixer if needed.
+
+    Idempotent: once the sounds are loaded, later calls return immediately.
+    """
+    global _sounds, _play_list
+    if _sounds:
+        return _sounds["move"]      # already loaded – don't decode everything again
+    init_mixer()
+    # Built in a local and published in one assignment: set_volume() may
+    # iterate _sounds from the main thread while this runs on the preload
+    # thread, so the shared dict must never change size
+    sounds = _load_sfx()
     # If hover or confirm sounds are not found, use existing sounds as fallbacks
-    if "hover" not in _sounds:
+    # (the same cached Sound object is shared, never reloaded)
+    if "hover" not in sounds:
         # Use ui sound as fallback for hover
-        if "ui" in _sounds:
-            _sounds["hover"] = _sounds["ui"]
-        elif "move" in _sounds:
-            _sounds["hover"] = _sounds["move"]
-    if "confirm" not in _sounds:
+        if "ui" in sounds:
+            sounds["hover"] = sounds["ui"]
+        elif "move" in sounds:
+            sounds["hover"] = sounds["move"]
+    if "confirm" not in sounds:
         # Use place sound as fallback for confirm
-        if "place" in _sounds:
-            _sounds["confirm"] = _sounds["place"]
-        elif "complete" in _sounds:
-            _sounds["confirm"] = _sounds["complete"]
+        if "place" in sounds:
+            sounds["confirm"] = sounds["place"]
+        elif "complete" in sounds:
+            sounds["confirm"] = sounds["complete"]
+    _reserve_channels()
+    # Channel.play() stops whatever that channel was playing, so repeats never queue
+    play_list: list[Optional[Callable[..., object]]] = [None] * len(SFX)
+    for key, snd in sounds.items():
+        sfx = _NAME_TO_ID[key]
+        play_list[sfx] = partial(_channels[sfx].play, snd)
+    _sounds = sounds
+    _play_list = play_list
+    # Re-apply after publishing – a set_volume() that ran mid-load saw
+    # the old (empty) dict but already stored _current_volume
+    if _current_volume is not None:
+        _apply_sfx_volume(_current_volume)
     return _sounds["move"]          # legacy compatibility
 
+_music_loaded = False
+
 def load_music():
-    """Load the ambient background music."""
+    """Load the ambient background music (idempotent)."""
+    global _music_loaded
+    if _music_loaded:
+        return
+    init_mixer()
     # Try both .wav and .mp3 extensions for ambient music
-    base = os.path.join('assets', 'audio')
+    base = _AUDIO_DIR
     music_path = os.path.join(base, 'ambient.wav')
     try:
         pygame.mixer.music.load(music_path)
@@ -79,30 +222,89 @@ def load_music():
         music_path = os.path.join(base, 'ambient.mp3')
         pygame.mixer.music.load(music_path)
     
-    pygame.mixer.music.set_volume(0.4)
+    pygame.mixer.music.set_volume(0.4 if _current_volume is None else _current_volume)
+    _music_loaded = True
 
 # -----------------------------------------------------------------
 # Public helpers used throughout the game
 # -----------------------------------------------------------------
+# Minimum seconds between repeats of chatty UI sounds (mouse motion can
+# fire hover hundreds of times a second), indexed by SFX id
+_MIN_INTERVAL = [0.0] * len(SFX)
+_MIN_INTERVAL[SFX.HOVER] = 0.05
+_MIN_INTERVAL[SFX.UI] = 0.03
+_last_played = [0.0] * len(SFX)
+
+def play_id(sfx: int) -> None:
+    """Play a sound by ``SFX`` id (e.g., play_id(SFX.MOVE)). No-op until loaded."""
+    gap = _MIN_INTERVAL[sfx]
+    if gap:
+        now = time.monotonic()
+        if now - _last_played[sfx] < gap:
+            return
+        _last_played[sfx] = now
+    fn = _play_list[sfx]
+    if fn:
+        fn()
+
 def play(name: str) -> None:
     """Play a sound by key (e.g., play('place')). Silently ignore unknown keys."""
-    if _sounds:
-        snd = _sounds.get(name)
-        if snd:
-            snd.play()
+    sfx = _NAME_TO_ID.get(name)
+    if sfx is not None:
+        play_id(sfx)
 
 def play_move() -> None:
     """Legacy function to play move sound for compatibility."""
-    play('move')
+    play_id(SFX.MOVE)
+
+def _apply_sfx_volume(level: float) -> None:
+    """Scale every loaded Sound by ``level`` and its relative mix."""
+    seen = set()
+    for key, snd in _sounds.items():
+        # Fallback keys share a Sound with their source – set it only once
+        if id(snd) in seen:
+            continue
+        seen.add(id(snd))
+        snd.set_volume(level * _RELATIVE_MIX.get(key, 1.0))
 
 def set_volume(level: float) -> None:
     """
     Set the master volume for music *and* all SFX.
     ``level`` is a float between 0.0 and 1.0.
+    Repeated calls with an unchanged level (e.g. slider drags) are skipped.
+    """
+    global _current_volume
+    if _current_volume is not None and abs(level - _current_volume) < 1e-3:
+        return
+    _current_volume = level
+    if _mixer_ready:
+        pygame.mixer.music.set_volume(level)
+    _apply_sfx_volume(level)
+
+_preload_thread: Optional[threading.Thread] = None
+
+def preload_async(start_ambient: bool = True) -> threading.Thread:
+    """
+    Load SFX and music on a daemon thread so start-up isn't blocked on
+    disk I/O and decoding. ``play()`` is a silent no-op until the sounds
+    are ready, so callers need no extra checks.
+
+    Only the first call starts a thread; later calls return that thread.
     """
-    pygame.mixer.music.set_volume(level)
-    for snd in _sounds.values():
-        snd.set_volume(level)
+    global _preload_thread
+    if _preload_thread is not None:
+        return _preload_thread
+
+    def _worker() -> None:
+        load_sfx()
+        load_music()
+        if start_ambient:
+            start_ambient_loop()
+
+    _preload_thread = threading.Thread(target=_worker, name="audio-preload", daemon=True)
+    _preload_thread.start()
+    return _preload_thread
 
 def start_ambient_loop():
+    init_mixer()
     pygame.mixer.music.play(-1)   # -1 → infinite loop
\ No newline at end of file
@@ -1,10 +1,30 @@
 """game/custom_puzzle.py – Custom puzzle creation with cropping tool."""
 
+import functools
 import pygame
 from typing import Optional, Callable, Dict, Any
 from .image_loader import ImageLoader
 from .cropping_tool import CroppingTool
 
+
+@functools.lru_cache(maxsize=16)
+def _font(size: int) -> pygame.font.Font:
+    """SysFont scans the system font list – build each size only once."""
+    return pygame.font.SysFont(None, size)
+
+
+def _render_button(rect: pygame.Rect, text: str, bg: tuple, border: tuple,
+                   font: pygame.font.Font) -> pygame.Surface:
+    """Compose a flat button (fill + border + centred caption) into one Surface."""
+    surf = pygame.Surface(rect.size)
+    local = surf.get_rect()
+    surf.fill(bg)
+    pygame.draw.rect(surf, border, local, 2)
+    txt = font.render(text, True, (255, 255, 255))
+    surf.blit(txt, txt.get_rect(center=local.center))
+    return surf
+
+
 class CustomPuzzleScreen:
     """Screen for creating custom puzzles from user images."""
     
@@ -19,11 +39,28 @@ class CustomPuzzleScreen:
         self.status = "Select an image to create your puzzle"
         
         # Fonts
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.font = pygame.font.SysFont(None, 36)
+        self.title_font = _font(48)
+        self.font = _font(36)
         
         # UI Elements
         self._create_ui_elements()
+
+        # Static text never changes – render it once instead of every frame
+        self._cx = screen_rect.centerx
+        self._title_surf = self.title_font.render("Custom Puzzle", True, (200, 230, 200))
+        self._select_btn_surf = _render_button(
+            self.select_btn, "Select Image", (70, 120, 90), (30, 60, 45), self.font
+        )
+        self._back_btn_surf = _render_button(
+            self.back_btn, "Back", (120, 100, 75), (85, 65, 45), self.font
+        )
+        self._status_surf = None
+        self._last_status = None
+
+        # Blit positions, so draw() is pure blits
+        self._rects = {
+            "title": self._title_surf.get_rect(center=(self._cx, 80)),
+        }
         
     def _create_ui_elements(self):
         """Create all UI buttons and elements."""
@@ -81,23 +118,15 @@ class CustomPuzzleScreen:
             surface.fill((10, 30, 20))
             
             # Title
-            title = self.title_font.render("Custom Puzzle", True, (200, 230, 200))
-            surface.blit(title, title.get_rect(center=(self.rect.centerx, 80)))
-            
-            # Status
-            status_surf = self.font.render(self.status, True, (180, 200, 180))
-            surface.blit(status_surf, status_surf.get_rect(center=(self.rect.centerx, 140)))
+            surface.blit(self._title_surf, self._rects["title"])
             
-            # Select button
-            pygame.draw.rect(surface, (70, 120, 90), self.select_btn)
-            pygame.draw.rect(surface, (30, 60, 45), self.select_btn, 2)
-            select_text = self.font.render("Select Image", True, (255, 255, 255))
-            select_rect = select_text.get_rect(center=self.select_btn.center)
-            surface.blit(select_text, select_rect)
+            # Status (re-rendered only when the message changes)
+            if self._last_status != self.status:
+                self._status_surf = self.font.render(self.status, True, (180, 200, 180))
+                self._rects["status"] = self._status_surf.get_rect(center=(self._cx, 140))
+                self._last_status = self.status
+            surface.blit(self._status_surf, self._rects["status"])
             
-            # Back button
-            pygame.draw.rect(surface, (120, 100, 75), self.back_btn)
-            pygame.draw.rect(surface, (85, 65, 45), self.back_btn, 2)
-            back_text = self.font.render("Back", True, (255, 255, 255))
-            back_rect = back_text.get_rect(center=self.back_btn.center)
-            surface.blit(back_text, back_rect)
\ No newline at end of file
+            # Buttons (pre-composed in __init__)
+            surface.blit(self._select_btn_surf, self.select_btn.topleft)
+            surface.blit(self._back_btn_surf, self.back_btn.topleft)
\ No newline at end of file
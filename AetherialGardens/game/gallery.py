@@ -3,26 +3,99 @@
 import os
 import json
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple, Callable  # Add Callable import
 import pygame
 from datetime import datetime
+from PIL import Image
+
+try:
+    import orjson  # Optional C-accelerated JSON; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialise ``obj`` to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# zlib level for saved PNGs – level 1 writes several times faster than
+# libpng's default 6 for only slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
+def _save_png(surface: pygame.Surface, path: str) -> None:
+    """Write ``surface`` as a PNG using a fast compression level."""
+    mode = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+    data = pygame.image.tobytes(surface, mode)
+    Image.frombuffer(mode, surface.get_size(), data, "raw", mode, 0, 1).save(
+        path, "PNG", compress_level=PNG_COMPRESS_LEVEL
+    )
+
+# Posted when a background thumbnail decode finishes, so an idle main
+# loop wakes up and redraws the gallery
+THUMB_READY = pygame.event.custom_type()
+
+def _post_thumb_ready(_future: Future) -> None:
+    try:
+        pygame.event.post(pygame.event.Event(THUMB_READY))
+    except pygame.error:
+        pass  # Display already shut down
+
+def _thumb_name(filename: str) -> str:
+    """Sidecar thumbnail filename for a memory image."""
+    root, ext = os.path.splitext(filename)
+    return f"{root}_thumb{ext}"
 
 class Gallery:
     """Manages saving and loading of completed puzzle images."""
     
+    # Edge length of the pre-generated sidecar thumbnails
+    THUMB_SIZE = 150
+    
+    # The append-only log is folded into gallery.json once it grows past these
+    LOG_COMPACT_BYTES = 4096
+    LOG_COMPACT_ENTRIES = 50
+    
+    # Number of decoded full-size memory images kept in memory
+    SURF_CACHE_SIZE = 4
+    
     def __init__(self):
         # Create gallery directory if it doesn't exist
         self.gallery_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "user_memories")
         os.makedirs(self.gallery_dir, exist_ok=True)
         
-        # Path to gallery metadata file
+        # Path to gallery metadata file (compacted snapshot) and the
+        # append-only change log replayed on top of it
         self.gallery_json_path = os.path.join(self.gallery_dir, "gallery.json")
+        self.gallery_log_path = os.path.join(self.gallery_dir, "gallery.jsonl")
+        self._log_entries = 0
+        
+        # Recently viewed full images, already converted (LRU)
+        self._surf_cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
         
         # Ensure gallery.json exists
         self._ensure_gallery_file()
         
         # Load gallery data
+        self._reload()
+    
+    def _reload(self) -> None:
+        """Rebuild the in-memory state from the snapshot plus the change log."""
         self.gallery_data = self._load_gallery_data()
+        # Index of the memory entries by filename (insertion-ordered, so
+        # it doubles as the source of truth for the serialised list)
+        self._by_name: Dict[str, Dict] = {
+            m["filename"]: m for m in self.gallery_data.setdefault("memories", [])
+        }
+        self._replay_log()
     
     def _ensure_gallery_file(self) -> None:
         """Create the gallery.json file with defaults if it does not exist."""
@@ -33,17 +106,61 @@ class Gallery:
     def _load_gallery_data(self) -> Dict:
         """Load gallery data from JSON file."""
         try:
-            with open(self.gallery_json_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self.gallery_json_path, "rb") as f:
+                return _loads(f.read())
         except (json.JSONDecodeError, FileNotFoundError):
             # If file is corrupted or missing, create a new one
             self._ensure_gallery_file()
             return {"memories": []}
     
     def _save_gallery_data(self) -> None:
-        """Save gallery data to JSON file."""
-        with open(self.gallery_json_path, "w", encoding="utf-8") as f:
-            json.dump(self.gallery_data, f, indent=2)
+        """Save gallery data to JSON file (atomically, via a temp file)."""
+        tmp_path = self.gallery_json_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(self.gallery_data, indent=True))
+        os.replace(tmp_path, self.gallery_json_path)
+    
+    # -----------------------------------------------------------------
+    # Append-only change log
+    # Each line is either a memory entry (added) or {"del": filename}.
+    # -----------------------------------------------------------------
+    def _replay_log(self) -> None:
+        """Apply any logged changes that aren't in the snapshot yet."""
+        try:
+            with open(self.gallery_log_path, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        
+        for line in lines:
+            try:
+                record = _loads(line)
+            except ValueError:
+                continue  # Torn write from a crash – skip it
+            if "del" in record:
+                self._by_name.pop(record["del"], None)
+            else:
+                self._by_name.setdefault(record["filename"], record)
+        self.gallery_data["memories"] = list(self._by_name.values())
+        self._log_entries = len(lines)
+    
+    def _append_log(self, record: Dict) -> None:
+        """Append one change record, compacting the log once it gets large."""
+        with open(self.gallery_log_path, "ab") as f:
+            f.write(_dumps(record) + b"\n")
+            size = f.tell()
+        self._log_entries += 1
+        if size > self.LOG_COMPACT_BYTES or self._log_entries > self.LOG_COMPACT_ENTRIES:
+            self._compact()
+    
+    def _compact(self) -> None:
+        """Fold the log into the snapshot and truncate it."""
+        # Rebuild from disk first – every change of ours is already logged,
+        # and another Gallery may have logged (or compacted) its own since
+        self._reload()
+        self._save_gallery_data()
+        open(self.gallery_log_path, "wb").close()
+        self._log_entries = 0
     
     def save_memory(self, image: pygame.Surface, puzzle_size: int, moves: int, stars: int) -> str:
         """
@@ -65,19 +182,26 @@ class Gallery:
         filepath = os.path.join(self.gallery_dir, filename)
         
         # Save the image
-        pygame.image.save(image, filepath)
+        _save_png(image, filepath)
+        
+        # Save a small sidecar thumbnail so the gallery never decodes full images
+        thumb_filename = _thumb_name(filename)
+        thumb = pygame.transform.smoothscale(image, (self.THUMB_SIZE, self.THUMB_SIZE))
+        _save_png(thumb, os.path.join(self.gallery_dir, thumb_filename))
         
         # Add to gallery data
         memory_entry = {
             "filename": filename,
+            "thumb": thumb_filename,
             "puzzle_size": puzzle_size,
             "moves": moves,
             "stars": stars,
             "date": datetime.now().isoformat()
         }
         
+        self._by_name[filename] = memory_entry
         self.gallery_data["memories"].append(memory_entry)
-        self._save_gallery_data()
+        self._append_log(memory_entry)
         
         return filename
     
@@ -86,11 +210,48 @@ class Gallery:
         return self.gallery_data.get("memories", [])
     
     def get_memory_image(self, filename: str) -> Optional[pygame.Surface]:
-        """Load a memory image by filename."""
+        """Load a memory image by filename (LRU cached – don't modify the result)."""
+        image = self._surf_cache.get(filename)
+        if image is not None:
+            self._surf_cache.move_to_end(filename)
+            return image
+        
         filepath = os.path.join(self.gallery_dir, filename)
-        if os.path.isfile(filepath):
-            return pygame.image.load(filepath).convert_alpha()
-        return None
+        if not os.path.isfile(filepath):
+            return None
+        image = pygame.image.load(filepath).convert_alpha()
+        self._surf_cache[filename] = image
+        if len(self._surf_cache) > self.SURF_CACHE_SIZE:
+            self._surf_cache.popitem(last=False)
+        return image
+    
+    def load_thumbnail_pixels(self, memory: Dict, size: int) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+        """
+        Decode the sidecar thumbnail for a memory entry to RGBA bytes.
+        
+        Only PIL and file I/O are used, so this is safe on a worker thread;
+        the caller turns the bytes into a surface on the main thread.
+        Memories saved before thumbnails existed get one generated (and
+        written to disk) from the full image on first request.
+        """
+        thumb_path = os.path.join(self.gallery_dir, memory.get("thumb") or _thumb_name(memory["filename"]))
+        if os.path.isfile(thumb_path):
+            with Image.open(thumb_path) as img:
+                thumb = img.convert("RGBA")
+        else:
+            filepath = os.path.join(self.gallery_dir, memory["filename"])
+            if not os.path.isfile(filepath):
+                return None
+            with Image.open(filepath) as img:
+                thumb = img.convert("RGBA").resize((self.THUMB_SIZE, self.THUMB_SIZE), Image.LANCZOS)
+            try:
+                thumb.save(thumb_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+            except OSError:
+                pass  # Not fatal – we'll just regenerate next time
+        
+        if thumb.size != (size, size):
+            thumb = thumb.resize((size, size), Image.LANCZOS)
+        return thumb.tobytes(), thumb.size
     
     def delete_memory(self, filename: str) -> bool:
         """
@@ -102,32 +263,43 @@ class Gallery:
         Returns:
             True if successful, False otherwise
         """
-        # Delete the image file
+        # Delete the image file (and its thumbnail)
         filepath = os.path.join(self.gallery_dir, filename)
         try:
             if os.path.isfile(filepath):
                 os.remove(filepath)
         except OSError:
             return False
+        thumb_path = os.path.join(self.gallery_dir, _thumb_name(filename))
+        try:
+            if os.path.isfile(thumb_path):
+                os.remove(thumb_path)
+        except OSError:
+            pass  # The memory itself is gone; a stray thumbnail is harmless
+        
+        self._surf_cache.pop(filename, None)
         
         # Remove from gallery data
-        self.gallery_data["memories"] = [
-            m for m in self.gallery_data["memories"] 
-            if m["filename"] != filename
-        ]
-        self._save_gallery_data()
+        if self._by_name.pop(filename, None) is not None:
+            self.gallery_data["memories"] = list(self._by_name.values())
+            self._append_log({"del": filename})
         
         return True
 
 class GalleryScreen:
     """UI screen for viewing the gallery of saved memories."""
+
+    # Maximum number of decoded thumbnails kept in memory
+    THUMB_CACHE_SIZE = 64
     
-    def __init__(self, screen_rect: pygame.Rect, back_cb: Callable[[], None]):
+    def __init__(self, screen_rect: pygame.Rect, back_cb: Callable[[], None],
+                 gallery: Optional[Gallery] = None):
         self.rect = screen_rect
         self.back_cb = back_cb
         
-        # Gallery manager
-        self.gallery = Gallery()
+        # Gallery manager – share the caller's so saves and deletes go
+        # through a single instance
+        self.gallery = gallery or Gallery()
         
         # UI state
         self.selected_memory = None
@@ -148,42 +320,136 @@ class GalleryScreen:
         self.fullscreen_back_btn = pygame.Rect(20, 20, 100, 50)
         self.delete_btn = pygame.Rect(screen_rect.width - 120, screen_rect.height - 70, 100, 50)
         
+        # Translucent info panel behind the fullscreen caption – built once
+        self.panel_height = 80
+        self.panel_surface = pygame.Surface((screen_rect.width, self.panel_height), pygame.SRCALPHA).convert_alpha()
+        self.panel_surface.fill((0, 0, 0, 180))
+        
+        # Thumbnail frame drawn once, then blitted over each thumbnail
+        self._border_tmpl = pygame.Surface((self.thumbnail_size, self.thumbnail_size), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(self._border_tmpl, (70, 120, 90), self._border_tmpl.get_rect(), 2)
+        
+        # Shown while a thumbnail is still being decoded
+        self._placeholder = pygame.Surface((self.thumbnail_size, self.thumbnail_size)).convert()
+        self._placeholder.fill((40, 60, 50))
+        
         # Scroll position
         self.scroll_y = 0
         self.max_scroll = 0
         
-        # Load thumbnails
-        self.thumbnails = []
+        # Memory metadata; thumbnails are decoded lazily as they scroll into view
+        self.memories: List[Dict] = []
+        self._thumb_cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+        # Thumbnail decodes run on worker threads (PIL releases the GIL while
+        # decoding); the pixels are turned into surfaces on the main thread
+        # in _collect_thumbs(). The pool only lives while the screen is shown.
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Future] = {}
+        # Rendered caption per distinct info string (many memories share one)
+        self._info_surf_cache: Dict[str, pygame.Surface] = {}
+        # (filename, scaled image) for the memory open in fullscreen view
+        self._fullscreen_cache: Optional[Tuple[str, pygame.Surface]] = None
         self._load_thumbnails()
     
+    def refresh(self) -> None:
+        """Pick up memories saved since the screen was last shown."""
+        self._load_thumbnails()
+        self.scroll_y = min(self.scroll_y, self.max_scroll)
+    
     def _load_thumbnails(self) -> None:
-        """Load all memory thumbnails."""
-        self.thumbnails = []
-        memories = self.gallery.get_memories()
+        """Collect the memories to show – no images are decoded here."""
+        # Shallow copies carry the pre-formatted caption, so it never ends
+        # up in the persisted gallery metadata
+        self.memories = [
+            dict(memory, _info_text=(
+                f"{memory['puzzle_size']}x{memory['puzzle_size']} • "
+                f"{memory['moves']} moves • {memory['stars']}★"
+            ))
+            for memory in self.gallery.get_memories()
+            if os.path.isfile(os.path.join(self.gallery.gallery_dir, memory["filename"]))
+        ]
         
-        for memory in memories:
-            image = self.gallery.get_memory_image(memory["filename"])
-            if image:
-                # Scale image to thumbnail size
-                thumbnail = pygame.transform.scale(image, (self.thumbnail_size, self.thumbnail_size))
-                self.thumbnails.append((thumbnail, memory))
+        # Drop cached thumbnails for memories that no longer exist
+        names = {memory["filename"] for memory in self.memories}
+        for filename in [f for f in self._thumb_cache if f not in names]:
+            del self._thumb_cache[filename]
+        for filename in [f for f in self._pending if f not in names]:
+            del self._pending[filename]
         
         # Calculate max scroll
-        rows = (len(self.thumbnails) + self.thumbnails_per_row - 1) // self.thumbnails_per_row
+        rows = (len(self.memories) + self.thumbnails_per_row - 1) // self.thumbnails_per_row
         total_height = rows * (self.thumbnail_size + self.thumbnail_margin) + 100  # 100 for title and padding
         self.max_scroll = max(0, total_height - self.rect.height)
     
+    def close(self) -> None:
+        """Stop the thumbnail workers, dropping any decodes not yet started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._pending.clear()
+    
+    def _decode_thumb(self, memory: Dict) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+        """Decode and size one thumbnail to RGBA bytes (runs on a worker thread)."""
+        try:
+            return self.gallery.load_thumbnail_pixels(memory, self.thumbnail_size)
+        except OSError:
+            return None
+    
+    def _collect_thumbs(self) -> None:
+        """Convert finished background decodes into cached surfaces."""
+        for filename, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            data = future.result()
+            if data is None:
+                continue  # Keep the finished future so it isn't resubmitted
+            del self._pending[filename]
+            pixels, size = data
+            self._thumb_cache[filename] = pygame.image.frombuffer(pixels, size, "RGBA").convert_alpha()
+            if len(self._thumb_cache) > self.THUMB_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+    
+    def _get_thumb(self, memory: Dict) -> Optional[pygame.Surface]:
+        """
+        Return the thumbnail for ``memory`` (LRU cached).
+        
+        Uncached thumbnails are decoded in the background; the placeholder
+        is returned until THUMB_READY brings the finished decode in.
+        """
+        filename = memory["filename"]
+        thumb = self._thumb_cache.get(filename)
+        if thumb is not None:
+            self._thumb_cache.move_to_end(filename)
+            return thumb
+        
+        future = self._pending.get(filename)
+        if future is None:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gallery-thumb")
+            future = self._pool.submit(self._decode_thumb, memory)
+            future.add_done_callback(_post_thumb_ready)
+            self._pending[filename] = future
+        if future.done() and future.result() is None:
+            return None  # Decode failed
+        return self._placeholder
+    
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events."""
+        if event.type == THUMB_READY:
+            self._collect_thumbs()
+            return
+        
         if self.viewing_fullscreen:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if self.fullscreen_back_btn.collidepoint(event.pos):
                     self.viewing_fullscreen = False
+                    self._fullscreen_cache = None
                 elif self.delete_btn.collidepoint(event.pos) and self.selected_memory:
                     # Delete the selected memory
                     if self.gallery.delete_memory(self.selected_memory["filename"]):
                         self.selected_memory = None
                         self.viewing_fullscreen = False
+                        self._fullscreen_cache = None
                         self._load_thumbnails()
             return
         
@@ -192,21 +458,20 @@ class GalleryScreen:
             
             # Check back button
             if self.back_btn.collidepoint(mouse_pos):
+                self.close()
                 self.back_cb()
                 return
             
-            # Check thumbnail clicks
-            for i, (thumbnail, memory) in enumerate(self.thumbnails):
-                row = i // self.thumbnails_per_row
-                col = i % self.thumbnails_per_row
-                
-                x = 20 + col * (self.thumbnail_size + self.thumbnail_margin)
-                y = 100 + row * (self.thumbnail_size + self.thumbnail_margin) - self.scroll_y
-                
-                thumbnail_rect = pygame.Rect(x, y, self.thumbnail_size, self.thumbnail_size)
-                
-                if thumbnail_rect.collidepoint(mouse_pos):
-                    self.selected_memory = memory
+            # Check thumbnail clicks – work out the grid cell under the
+            # cursor directly instead of testing every thumbnail
+            row_h = self.thumbnail_size + self.thumbnail_margin
+            mx, my = mouse_pos[0] - 20, mouse_pos[1] - 100 + self.scroll_y
+            if mx >= 0 and my >= 0:
+                col, row = mx // row_h, my // row_h
+                i = row * self.thumbnails_per_row + col
+                in_cell = mx % row_h < self.thumbnail_size and my % row_h < self.thumbnail_size
+                if col < self.thumbnails_per_row and in_cell and i < len(self.memories):
+                    self.selected_memory = self.memories[i]
                     self.viewing_fullscreen = True
                     return
         
@@ -229,28 +494,37 @@ class GalleryScreen:
         title = self.title_font.render("Memory Gallery", True, (200, 230, 200))
         surface.blit(title, title.get_rect(center=(self.rect.centerx, 40)))
         
-        # Draw thumbnails
-        for i, (thumbnail, memory) in enumerate(self.thumbnails):
+        # Draw only the rows that intersect the viewport: the first row with
+        # y + thumbnail_size > 0 through the last row with y < height
+        row_h = self.thumbnail_size + self.thumbnail_margin
+        top = self.scroll_y - 100
+        first_row = max(0, (top - self.thumbnail_size) // row_h + 1)
+        last_row = (top + self.rect.height - 1) // row_h
+        start = first_row * self.thumbnails_per_row
+        end = min(len(self.memories), (last_row + 1) * self.thumbnails_per_row)
+        
+        for i in range(start, end):
+            memory = self.memories[i]
             row = i // self.thumbnails_per_row
             col = i % self.thumbnails_per_row
             
-            x = 20 + col * (self.thumbnail_size + self.thumbnail_margin)
-            y = 100 + row * (self.thumbnail_size + self.thumbnail_margin) - self.scroll_y
-            
-            # Skip if outside visible area
-            if y + self.thumbnail_size < 0 or y > self.rect.height:
-                continue
+            x = 20 + col * row_h
+            y = 100 + row * row_h - self.scroll_y
             
             # Draw thumbnail
-            surface.blit(thumbnail, (x, y))
+            thumbnail = self._get_thumb(memory)
+            if thumbnail:
+                surface.blit(thumbnail, (x, y))
             
             # Draw border
-            pygame.draw.rect(surface, (70, 120, 90), (x, y, self.thumbnail_size, self.thumbnail_size), 2)
+            surface.blit(self._border_tmpl, (x, y))
             
             # Draw info
-            date_str = memory["date"][:10]  # Just the date part
-            info_text = f"{memory['puzzle_size']}x{memory['puzzle_size']} • {memory['moves']} moves • {memory['stars']}★"
-            info_surf = self.small_font.render(info_text, True, (180, 200, 180))
+            info_text = memory["_info_text"]
+            info_surf = self._info_surf_cache.get(info_text)
+            if info_surf is None:
+                info_surf = self.small_font.render(info_text, True, (180, 200, 180)).convert_alpha()
+                self._info_surf_cache[info_text] = info_surf
             surface.blit(info_surf, (x, y + self.thumbnail_size + 5))
         
         # Draw back button
@@ -272,29 +546,30 @@ class GalleryScreen:
         if not self.selected_memory:
             return
         
-        # Load the full image
-        image = self.gallery.get_memory_image(self.selected_memory["filename"])
-        if not image:
-            return
-        
-        # Scale image to fit screen
         screen_w, screen_h = self.rect.width, self.rect.height
-        img_w, img_h = image.get_size()
+        filename = self.selected_memory["filename"]
         
-        scale = min(screen_w / img_w, screen_h / img_h)
-        new_w, new_h = int(img_w * scale), int(img_h * scale)
-        scaled_image = pygame.transform.scale(image, (new_w, new_h))
+        if self._fullscreen_cache and self._fullscreen_cache[0] == filename:
+            scaled_image = self._fullscreen_cache[1]
+        else:
+            # Load the full image and scale it to fit the screen – once per memory
+            image = self.gallery.get_memory_image(filename)
+            if not image:
+                return
+            
+            img_w, img_h = image.get_size()
+            scale = min(screen_w / img_w, screen_h / img_h)
+            new_w, new_h = int(img_w * scale), int(img_h * scale)
+            scaled_image = pygame.transform.smoothscale(image, (new_w, new_h))
+            self._fullscreen_cache = (filename, scaled_image)
         
         # Center the image
         img_rect = scaled_image.get_rect(center=(screen_w // 2, screen_h // 2))
         surface.blit(scaled_image, img_rect)
         
         # Draw info panel
-        panel_height = 80
-        panel_rect = pygame.Rect(0, screen_h - panel_height, screen_w, panel_height)
-        panel_surface = pygame.Surface((screen_w, panel_height), pygame.SRCALPHA)
-        panel_surface.fill((0, 0, 0, 180))
-        surface.blit(panel_surface, (0, screen_h - panel_height))
+        panel_height = self.panel_height
+        surface.blit(self.panel_surface, (0, screen_h - panel_height))
         
         # Draw info text
         date_str = self.selected_memory["date"][:10]  # Just the date part
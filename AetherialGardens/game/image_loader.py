@@ -11,7 +11,20 @@ from PIL import Image
 # Constants
 # -----------------------------------------------------------------
 MAX_IMAGE_WIDTH = 1920  # Maximum width before downscaling
-SUPPORTED_FORMATS = ['.png', '.jpg', '.jpeg', '.bmp']
+SUPPORTED_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.bmp'})
+
+# -----------------------------------------------------------------
+# Hidden tkinter root, created on the first dialog and reused – Tk()
+# bootstraps a whole Tcl interpreter, which is too slow to do per open
+# -----------------------------------------------------------------
+_tk_root: Optional[tk.Tk] = None
+
+def _get_tk_root() -> tk.Tk:
+    global _tk_root
+    if _tk_root is None:
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()
+    return _tk_root
 
 class ImageLoader:
     """Handles file selection and image processing for custom puzzles."""
@@ -30,15 +43,15 @@ class ImageLoader:
             bool: True if a file was selected, False if cancelled or error.
         """
         try:
-            # Initialize tkinter root window (hidden)
-            root = tk.Tk()
-            root.withdraw()
+            # Hidden tkinter root window (kept alive between dialogs)
+            root = _get_tk_root()
             
             # Set the dialog to open in the user's home directory by default
             initial_dir = os.path.expanduser("~")
             
             # Open file dialog with supported image formats
             file_path = tkinter.filedialog.askopenfilename(
+                parent=root,
                 title="Select an image for your puzzle",
                 initialdir=initial_dir,
                 filetypes=[
@@ -50,15 +63,15 @@ class ImageLoader:
                 ]
             )
             
-            # Clean up tkinter
-            root.destroy()
+            # Let Tk finish tearing down the dialog window
+            root.update()
             
             # Check if a file was selected
             if not file_path:
                 return False
                 
             # Verify file extension
-            _, ext = os.path.splitext(file_path.lower())
+            ext = os.path.splitext(file_path)[1].lower()
             if ext not in SUPPORTED_FORMATS:
                 print(f"Unsupported file format: {ext}")
                 return False
@@ -91,28 +104,45 @@ class ImageLoader:
             pil_image = Image.open(self.selected_image_path)
             self.original_size = pil_image.size
             
+            # Image.open only reads the header – if no downscale is needed,
+            # let pygame decode the file straight into a Surface
+            if pil_image.width <= MAX_IMAGE_WIDTH:
+                try:
+                    surface = pygame.image.load(self.selected_image_path)
+                except pygame.error:
+                    surface = None  # Format SDL_image can't read – fall back to PIL
+                if surface is not None:
+                    # Palette/greyscale files load as 8-bit surfaces, which
+                    # smoothscale rejects – convert to 32-bit display format
+                    if surface.get_flags() & pygame.SRCALPHA:
+                        self.processed_image = surface.convert_alpha()
+                    else:
+                        self.processed_image = surface.convert()
+                    self.processed_size = self.processed_image.get_size()
+                    pil_image.close()
+                    return True
+            
             # Check if image needs downscaling
             if pil_image.width > MAX_IMAGE_WIDTH:
-                # Calculate new height maintaining aspect ratio
-                aspect_ratio = pil_image.height / pil_image.width
-                new_width = MAX_IMAGE_WIDTH
-                new_height = int(new_width * aspect_ratio)
-                
-                # Resize image
-                pil_image = pil_image.resize((new_width, new_height), Image.LANCZOS)
-                print(f"Image downscaled from {self.original_size} to ({new_width}, {new_height})")
+                # thumbnail() keeps the aspect ratio; reducing_gap does a cheap
+                # box-reduce first so Lanczos only touches ~the target pixels
+                pil_image.thumbnail(
+                    (MAX_IMAGE_WIDTH, pil_image.height), Image.LANCZOS, reducing_gap=3.0
+                )
+                print(f"Image downscaled from {self.original_size} to {pil_image.size}")
                 
             self.processed_size = pil_image.size
             
             # Convert PIL image to Pygame Surface
-            # Convert RGB to RGBA if needed
-            if pil_image.mode != 'RGBA':
-                pil_image = pil_image.convert('RGBA')
+            # Puzzle tiles are blitted opaque – only keep alpha if the source has it
+            has_alpha = pil_image.mode in ('RGBA', 'LA') or 'transparency' in pil_image.info
+            mode = 'RGBA' if has_alpha else 'RGB'
+            if pil_image.mode != mode:
+                pil_image = pil_image.convert(mode)
                 
-            # Convert to Pygame format
-            raw_data = pil_image.tobytes()
-            size = pil_image.size
-            self.processed_image = pygame.image.fromstring(raw_data, size, 'RGBA')
+            # Wrap the pixel bytes directly instead of re-parsing a copy
+            surface = pygame.image.frombuffer(pil_image.tobytes(), pil_image.size, mode)
+            self.processed_image = surface.convert_alpha() if has_alpha else surface.convert()
             
             return True
             
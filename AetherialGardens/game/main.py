@@ -1,7 +1,12 @@
 """game/main.py – entry point (now with a Settings screen)."""
 
+import copy
 import sys
+import time
 import pygame
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # -----------------------------------------------------------------
@@ -10,12 +15,11 @@ from pathlib import Path
 from .puzzle import Board
 from .ui import Menu, HUD, LevelSelect, Button
 from .audio import (
-    init_mixer,
-    load_sfx,
-    load_music,
-    play_move,
-    start_ambient_loop,
-    play,
+    pre_init_mixer,
+    close_mixer_until_needed,
+    preload_async,
+    play_id,
+    SFX,
     set_volume,                # <-- NEW
 )
 from .save import load_progress, save_progress, star_key
@@ -25,7 +29,7 @@ from .settings import SettingsScreen   # <-- NEW
 from .image_loader import ImageLoader
 from .custom_puzzle import CustomPuzzleScreen
 from .cropping_tool import CroppingTool
-from .gallery import Gallery, GalleryScreen  # <-- NEW
+from .gallery import Gallery, GalleryScreen, THUMB_READY  # <-- NEW
 
 # -----------------------------------------------------------------
 # Constants
@@ -38,18 +42,79 @@ FPS = 60
 # -----------------------------------------------------------------
 # pygame init
 # -----------------------------------------------------------------
+pre_init_mixer()               # mixer settings must be set before pygame.init()
 pygame.init()
+close_mixer_until_needed()     # pygame.init() opened it; audio loads reopen it
 pygame.display.set_caption(WINDOW_TITLE)
-screen = pygame.display.set_mode(WINDOW_SIZE)
+# SCALED gives an SDL renderer-backed window (GPU presentation); vsync
+# is only a request, so fall back to an unsynced window if it's refused
+try:
+    screen = pygame.display.set_mode(WINDOW_SIZE, pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+except pygame.error:
+    screen = pygame.display.set_mode(WINDOW_SIZE, pygame.SCALED | pygame.DOUBLEBUF)
 clock = pygame.time.Clock()
 
-# -----------------------------------------------------------------
-# Audio init
-# -----------------------------------------------------------------
-init_mixer()
-_move_sfx = load_sfx()          # populates the internal _sounds dict
-load_music()
-start_ambient_loop()
+# Only queue events some screen actually handles (plus the window events
+# that mean the frame must be redrawn); SDL drops everything else before
+# a Python Event object is ever created
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([
+    pygame.QUIT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED,
+    THUMB_READY,
+])
+
+# Fonts and static text used every frame – built once, not per frame
+_SCREEN_CENTER = (WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2)
+TILE_FONT = pygame.font.SysFont(None, 48)
+SOLVED_FONT = pygame.font.SysFont(None, 72)
+BUTTON_FONT = pygame.font.SysFont(None, 36)
+_SOLVED_SURF = SOLVED_FONT.render("Puzzle solved!", True, (255, 255, 255)).convert_alpha()
+_SOLVED_RECT = _SOLVED_SURF.get_rect(center=(_SCREEN_CENTER[0], _SCREEN_CENTER[1] - 50))
+# "Save to Gallery" button on the solved overlay – WINDOW_SIZE is fixed,
+# so the click target and its label position are constants too
+SAVE_BTN_RECT = pygame.Rect(_SCREEN_CENTER[0] - 100, _SCREEN_CENTER[1] + 50, 200, 50)
+_SAVE_TEXT_SURF = BUTTON_FONT.render("Save to Gallery", True, (255, 255, 255)).convert_alpha()
+_SAVE_TEXT_RECT = _SAVE_TEXT_SURF.get_rect(center=SAVE_BTN_RECT.center)
+_SAVED_MSG_SURF = BUTTON_FONT.render("Saved to Gallery!", True, (100, 255, 100)).convert_alpha()
+_SAVED_MSG_RECT = _SAVED_MSG_SURF.get_rect(center=(_SCREEN_CENTER[0], _SCREEN_CENTER[1] + 120))
+# Dimming layer behind the solved message (SRCALPHA alloc + fill is slow).
+# Everything pre-rendered here is converted to the display format so
+# blits are plain copies instead of per-pixel format conversions.
+_SOLVED_OVERLAY = pygame.Surface(WINDOW_SIZE, pygame.SRCALPHA).convert_alpha()
+_SOLVED_OVERLAY.fill((0, 0, 0, 120))
+# Opaque black fade layer; per-frame opacity comes from set_alpha()
+_TRANSITION_SURF = pygame.Surface(WINDOW_SIZE).convert()
+_TRANSITION_SURF.fill((0, 0, 0))
+
+def load_image(path, alpha: bool = False) -> pygame.Surface:
+    """Load an image straight into the display's pixel format.
+
+    Unconverted surfaces are re-converted on every blit, so every image
+    loaded here goes through convert()/convert_alpha() once up front.
+    """
+    surf = pygame.image.load(str(path))
+    return surf.convert_alpha() if alpha else surf.convert()
+
+# Level backgrounds, decoded and scaled once per level: bg_path → Surface
+_bg_cache: dict[Path, pygame.Surface | None] = {}
+
+def get_background(path):
+    """Return the screen-sized background for ``path`` (None if unavailable)."""
+    if path is None:
+        return None
+    if path not in _bg_cache:
+        surf = None  # No background – the render loop falls back to BG_COLOR
+        # A stat settles the common "level has no art" case without raising
+        if Path(path).is_file():
+            try:
+                surf = pygame.transform.scale(load_image(path), WINDOW_SIZE)
+            except pygame.error:
+                print(f"Could not load background: {path}")
+        _bg_cache[path] = surf   # failures are cached too, so we never retry per frame
+    return _bg_cache[path]
 
 # -----------------------------------------------------------------
 # Custom puzzle initialization happens after UI objects are created
@@ -64,18 +129,63 @@ if progress.get("muted", False):
     set_volume(0.0)
 else:
     set_volume(progress.get("volume", 0.4))
+    # SFX + ambient music load in the background; this is what opens the
+    # mixer, so a muted session never starts the audio thread at all
+    preload_async()
+
+# -----------------------------------------------------------------
+# Debounced progress saves – a volume-slider drag changes progress many
+# times a second, so callers only mark it dirty and the main loop writes
+# at most once per SAVE_DEBOUNCE_MS (plus on state switches and at exit)
+# -----------------------------------------------------------------
+SAVE_DEBOUNCE_MS = 500
+progress_dirty = False
+last_save_ms = 0
+
+# Writes run on a single worker thread (so they stay in order) and each
+# gets a snapshot, so the game can keep mutating progress meanwhile
+_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress-save")
+
+def save_progress_async() -> None:
+    _save_executor.submit(save_progress, copy.deepcopy(progress))
+
+def mark_progress_dirty() -> None:
+    global progress_dirty
+    progress_dirty = True
+
+def flush_progress(force: bool = False) -> None:
+    """Write progress if it changed and the debounce window has passed."""
+    global progress_dirty, last_save_ms
+    if not progress_dirty:
+        return
+    now = pygame.time.get_ticks()
+    if force or now - last_save_ms >= SAVE_DEBOUNCE_MS:
+        save_progress_async()
+        progress_dirty = False
+        last_save_ms = now
 
 # -----------------------------------------------------------------
 # Game‑state flags
 # -----------------------------------------------------------------
-STATE_MENU = "menu"
-STATE_LEVEL_SELECT = "level_select"
-STATE_PLAYING = "playing"
-STATE_PAUSED = "paused"
-STATE_SETTINGS = "settings"      # ★‑Settings addition
-STATE_CUSTOM_PUZZLE = "custom_puzzle"
-STATE_CROPPING = "cropping"
-STATE_GALLERY = "gallery"  # <-- NEW
+class GameState(IntEnum):
+    """Screen ids – int compares/hashes in the per-event dispatch, not str."""
+    MENU = 0
+    LEVEL_SELECT = 1
+    PLAYING = 2
+    PAUSED = 3
+    SETTINGS = 4
+    CUSTOM_PUZZLE = 5
+    CROPPING = 6
+    GALLERY = 7
+
+STATE_MENU = GameState.MENU
+STATE_LEVEL_SELECT = GameState.LEVEL_SELECT
+STATE_PLAYING = GameState.PLAYING
+STATE_PAUSED = GameState.PAUSED
+STATE_SETTINGS = GameState.SETTINGS      # ★‑Settings addition
+STATE_CUSTOM_PUZZLE = GameState.CUSTOM_PUZZLE
+STATE_CROPPING = GameState.CROPPING
+STATE_GALLERY = GameState.GALLERY  # <-- NEW
 
 game_state = STATE_MENU
 selected_level = None
@@ -83,7 +193,11 @@ board = None
 custom_puzzle_screen = None
 cropping_tool = None
 gallery_screen = None  # <-- NEW
+gallery = None         # Gallery instance for saving, see get_gallery()
 just_saved_to_gallery = False  # <-- NEW: Track if we just saved to gallery
+solved_image = None      # cropped image of the solved board
+show_save_button = False # solved board is a custom puzzle with an image to save
+current_bg = None        # pre-scaled background of the level being played
 
 # -----------------------------------------------------------------
 # Screen transition variables
@@ -91,7 +205,7 @@ just_saved_to_gallery = False  # <-- NEW: Track if we just saved to gallery
 transition_alpha = 255  # Start with no transition (fully visible)
 in_transition = False   # Whether a transition is currently happening
 transition_duration = 500  # Duration of transition in milliseconds
-transition_start_time = 0
+transition_start_time = 0.0   # time.perf_counter() when the fade began
 
 # -----------------------------------------------------------------
 # UI objects
@@ -119,8 +233,9 @@ def restart_current_level():
         star_hud.set_rating(0)
 
 def start_game(level_info):
-    global game_state, board, selected_level, hud, star_hud
+    global game_state, board, selected_level, hud, star_hud, current_bg
     selected_level = level_info
+    current_bg = get_background(level_info.bg_path)   # load + scale once per level
     board = Board(
         rows=level_info.rows,
         cols=level_info.rows,
@@ -135,8 +250,9 @@ def start_game(level_info):
     star_hud.set_rating(0)
 
 def start_custom_game(level_info):
-    global game_state, board, selected_level, hud, star_hud
+    global game_state, board, selected_level, hud, star_hud, current_bg
     selected_level = level_info
+    current_bg = None   # custom puzzles sit on the plain BG_COLOR
     board = Board(
         rows=level_info["rows"],
         cols=level_info["rows"],
@@ -152,6 +268,10 @@ def start_custom_game(level_info):
     game_state = STATE_PLAYING
     star_hud.set_rating(0)
 
+# -----------------------------------------------------------------
+# Screens most sessions never open are built on first visit; each
+# initialiser registers the new screen in the dispatch tables below
+# -----------------------------------------------------------------
 def init_custom_puzzle_screen():
     global custom_puzzle_screen
     custom_puzzle_screen = CustomPuzzleScreen(
@@ -159,54 +279,31 @@ def init_custom_puzzle_screen():
         back_cb=lambda: switch_state(STATE_MENU),
         start_game_cb=start_custom_game
     )
-    
-def update_menu_with_custom():
-    global menu
-    # Reinitialize the menu to add custom puzzle button
-    menu = Menu(
+    EVENT_HANDLERS[STATE_CUSTOM_PUZZLE] = custom_puzzle_screen.handle_event
+    UPDATE_HANDLERS[STATE_CUSTOM_PUZZLE] = custom_puzzle_screen.update
+    DRAW_HANDLERS[STATE_CUSTOM_PUZZLE] = custom_puzzle_screen.draw
+
+def init_gallery_screen():
+    global gallery_screen
+    gallery_screen = GalleryScreen(
         pygame.Rect(0, 0, *WINDOW_SIZE),
-        start_cb=lambda: switch_state(STATE_LEVEL_SELECT),
-        settings_cb=lambda: switch_state(STATE_SETTINGS),
-        quit_cb=quit_game,
+        back_cb=lambda: switch_state(STATE_MENU),
+        gallery=get_gallery()
     )
-    # Add custom puzzle button
-    custom_rect = pygame.Rect(0, 0, 250, 60)
-    custom_rect.centerx = WINDOW_SIZE[0] // 2
-    # Position the custom puzzle button between the settings and quit buttons
-    # The original buttons are: Start, Settings, Quit
-    # So we need to insert the Custom Puzzle button after Settings
-    custom_button = Button(custom_rect, "Custom Puzzle", lambda: switch_state(STATE_CUSTOM_PUZZLE))
-    
-    # Instead of updating the Menu class, we'll directly modify this menu after creating it
-    # We'll reinitialize the menu with all buttons including custom puzzle
-    btn_w, btn_h = 250, 60
-    spacing = 50
-    cx = WINDOW_SIZE[0] // 2
-    start_y = (WINDOW_SIZE[1] - 4 * (btn_h + spacing)) // 2 + 80  # Adjusted for 4 buttons
-    
-    # Create new buttons with custom puzzle added
-    start_rect = pygame.Rect(0, 0, btn_w, btn_h)
-    start_rect.centerx = cx
-    start_rect.y = start_y
-    
-    settings_rect = pygame.Rect(0, 0, btn_w, btn_h)
-    settings_rect.centerx = cx
-    settings_rect.y = start_y + btn_h + spacing
-    
-    custom_rect = pygame.Rect(0, 0, btn_w, btn_h)
-    custom_rect.centerx = cx
-    custom_rect.y = start_y + 2 * (btn_h + spacing)
-    
-    quit_rect = pygame.Rect(0, 0, btn_w, btn_h)
-    quit_rect.centerx = cx
-    quit_rect.y = start_y + 3 * (btn_h + spacing)
-    
-    menu.buttons = [
-        Button(start_rect, "Start", lambda: switch_state(STATE_LEVEL_SELECT)),
-        Button(settings_rect, "Settings", lambda: switch_state(STATE_SETTINGS)),
-        Button(custom_rect, "Custom Puzzle", lambda: switch_state(STATE_CUSTOM_PUZZLE)),
-        Button(quit_rect, "Quit", quit_game),
-    ]
+    EVENT_HANDLERS[STATE_GALLERY] = gallery_screen.handle_event
+    DRAW_HANDLERS[STATE_GALLERY] = gallery_screen.draw
+
+_LAZY_SCREENS = {
+    STATE_CUSTOM_PUZZLE: init_custom_puzzle_screen,
+    STATE_GALLERY: init_gallery_screen,
+}
+
+def get_gallery() -> Gallery:
+    """The single Gallery shared by saving and the gallery screen, created on first use."""
+    global gallery
+    if gallery is None:
+        gallery = Gallery()
+    return gallery
 
 def toggle_pause():
     global game_state
@@ -227,14 +324,16 @@ def set_volume_callback(level: float) -> None:
     progress["volume"] = level
     if not progress.get("muted", False):
         set_volume(level)          # apply immediately
-    save_progress(progress)
+    mark_progress_dirty()
 
 def toggle_mute() -> None:
     muted = not progress.get("muted", False)
     progress.setdefault("muted", False)
     progress["muted"] = muted
     set_volume(0.0 if muted else progress.get("volume", 0.4))
-    save_progress(progress)
+    if not muted:
+        preload_async()    # first unmute of a muted session loads audio
+    mark_progress_dirty()
 
 settings_screen = SettingsScreen(
     pygame.Rect(0, 0, *WINDOW_SIZE),
@@ -273,7 +372,7 @@ def start_transition():
     global in_transition, transition_alpha, transition_start_time
     in_transition = True
     transition_alpha = 0  # Start fully transparent
-    transition_start_time = pygame.time.get_ticks()
+    transition_start_time = time.perf_counter()
 
 def finish_transition():
     """Complete the transition and update game state."""
@@ -286,329 +385,313 @@ target_state = None
 
 def switch_state(new_state):
     global target_state
+    init_screen = _LAZY_SCREENS.pop(new_state, None)
+    if init_screen:
+        init_screen()
+    elif new_state == STATE_GALLERY:
+        gallery_screen.refresh()  # Show memories saved since the last visit
     start_transition()
     # For this implementation, we'll handle the actual state change after the transition
     target_state = new_state
 
 def apply_state_change():
     """Actually apply the state change after transition."""
-    global game_state, target_state
+    global game_state, target_state, dirty
     if target_state is not None:
         game_state = target_state
         target_state = None
-
-# Initialize custom puzzle screen after all functions are defined
-custom_puzzle_screen = CustomPuzzleScreen(
-    pygame.Rect(0, 0, *WINDOW_SIZE),
-    back_cb=lambda: switch_state(STATE_MENU),
-    start_game_cb=start_custom_game
-)
-
-# Initialize gallery screen after all functions are defined
-gallery_screen = GalleryScreen(
-    pygame.Rect(0, 0, *WINDOW_SIZE),
-    back_cb=lambda: switch_state(STATE_MENU)
-)
-
-# Add gallery instance for saving
-gallery = Gallery()
+        dirty = True
+        flush_progress(force=True)
 
 # Add custom puzzle button to the menu
 from .ui import Button
+
+def _stack_layout(center_x: int, start_y: int, n: int, w: int, h: int, gap: int) -> list[pygame.Rect]:
+    """Return ``n`` w×h rects stacked vertically from ``start_y``, centred on ``center_x``."""
+    rects = []
+    for i in range(n):
+        r = pygame.Rect(0, 0, w, h)
+        r.centerx = center_x
+        r.y = start_y + i * (h + gap)
+        rects.append(r)
+    return rects
+
 w, h = WINDOW_SIZE
 btn_w, btn_h = 250, 60
 spacing = 50
 cx = WINDOW_SIZE[0] // 2
-# Calculate new total height for 4 buttons instead of 3
-total_menu_height = btn_h * 4 + spacing * 3  # 4 buttons + 3 spaces
-start_y = (h - total_menu_height) // 2 + 80
-
-# Create new button positions for: Start, Settings, Custom Puzzle, Quit
-start_rect = pygame.Rect(0, 0, btn_w, btn_h)
-start_rect.centerx = cx
-start_rect.y = start_y
-
-settings_rect = pygame.Rect(0, 0, btn_w, btn_h)
-settings_rect.centerx = cx
-settings_rect.y = start_y + btn_h + spacing
-
-custom_rect = pygame.Rect(0, 0, btn_w, btn_h)
-custom_rect.centerx = cx
-custom_rect.y = start_y + 2 * (btn_h + spacing)
-
-quit_rect = pygame.Rect(0, 0, btn_w, btn_h)
-quit_rect.centerx = cx
-quit_rect.y = start_y + 3 * (btn_h + spacing)
-
 # Calculate new total height for 5 buttons instead of 3 (with gallery and custom puzzle added)
 total_menu_height = btn_h * 5 + spacing * 4  # 5 buttons + 4 spaces
 start_y = (h - total_menu_height) // 2 + 80
 
-# Create new button positions for: Start, Settings, Custom Puzzle, Gallery, Quit
-start_rect = pygame.Rect(0, 0, btn_w, btn_h)
-start_rect.centerx = cx
-start_rect.y = start_y
-
-settings_rect = pygame.Rect(0, 0, btn_w, btn_h)
-settings_rect.centerx = cx
-settings_rect.y = start_y + btn_h + spacing
-
-custom_rect = pygame.Rect(0, 0, btn_w, btn_h)
-custom_rect.centerx = cx
-custom_rect.y = start_y + 2 * (btn_h + spacing)
-
-gallery_rect = pygame.Rect(0, 0, btn_w, btn_h)
-gallery_rect.centerx = cx
-gallery_rect.y = start_y + 3 * (btn_h + spacing)
-
-quit_rect = pygame.Rect(0, 0, btn_w, btn_h)
-quit_rect.centerx = cx
-quit_rect.y = start_y + 4 * (btn_h + spacing)
+# Button positions for: Start, Settings, Custom Puzzle, Gallery, Quit
+start_rect, settings_rect, custom_rect, gallery_rect, quit_rect = _stack_layout(
+    cx, start_y, 5, btn_w, btn_h, spacing
+)
 
 # Reconstruct the menu buttons with all buttons
 menu.buttons = [
-    Button(start_rect, "Start", lambda: switch_state(STATE_LEVEL_SELECT)),
-    Button(settings_rect, "Settings", lambda: switch_state(STATE_SETTINGS)),
-    Button(custom_rect, "Custom Puzzle", lambda: switch_state(STATE_CUSTOM_PUZZLE)),
-    Button(gallery_rect, "Gallery", lambda: switch_state(STATE_GALLERY)),
+    Button(start_rect, "Start", partial(switch_state, STATE_LEVEL_SELECT)),
+    Button(settings_rect, "Settings", partial(switch_state, STATE_SETTINGS)),
+    Button(custom_rect, "Custom Puzzle", partial(switch_state, STATE_CUSTOM_PUZZLE)),
+    Button(gallery_rect, "Gallery", partial(switch_state, STATE_GALLERY)),
     Button(quit_rect, "Quit", quit_game),
 ]
 
+# -----------------------------------------------------------------
+# Per-state handlers – the main loop dispatches through these tables
+# -----------------------------------------------------------------
+def on_puzzle_solved():
+    """One-shot bookkeeping for the move that solves the board."""
+    global solved_image, show_save_button
+    rating = StarHUD.compute_rating(selected_level.rows, hud.move_count)
+    star_hud.set_rating(rating)
+
+    size_key = star_key(selected_level.rows)
+
+    new_best = False
+
+    # Best‑move logic
+    best_moves = progress.get("best_moves", {}).get(size_key)
+    if best_moves is None or hud.move_count < best_moves:
+        progress.setdefault("best_moves", {})[size_key] = hud.move_count
+        new_best = True
+
+    # Best‑star logic
+    best_star = progress.get("best_stars", {}).get(size_key, 0)
+    if rating > best_star:
+        progress.setdefault("best_stars", {})[size_key] = rating
+        new_best = True
+
+    play_id(SFX.COMPLETE)   # SFX for puzzle solved
+    if new_best:
+        save_progress_async()  # don't lose a new best to a crash
+
+    # Get the cropped image for saving – the board can't change again
+    # until a tile moves, so the click handler and draw reuse this
+    solved_image = board.get_cropped_image()
+    # Only custom puzzles (which carry their source image) offer a save
+    show_save_button = bool(solved_image) and (
+        (isinstance(selected_level, dict) and 'custom_image' in selected_level)
+        or hasattr(selected_level, 'custom_image')
+    )
+
+def _try_tile_move(pos) -> bool:
+    """Click the board at ``pos``; count and sound the move if a tile slid."""
+    # A tile moved iff the empty slot moved
+    prev_empty = board.empty_pos
+    board.click_at(pos)
+    if board.empty_pos == prev_empty:
+        return False
+    hud.increment_moves()
+    play_id(SFX.MOVE)
+    play_id(SFX.PLACE)
+    return True
+
+def handle_playing_event(event):
+    global just_saved_to_gallery
+    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        # Check if puzzle is solved and save button is clicked
+        if board.solved and show_save_button and SAVE_BTN_RECT.collidepoint(event.pos):
+            # Save to gallery
+            rating = StarHUD.compute_rating(selected_level.rows, hud.move_count)
+            get_gallery().save_memory(
+                solved_image, 
+                selected_level["rows"] if isinstance(selected_level, dict) else selected_level.rows, 
+                hud.move_count, 
+                rating
+            )
+            # Set flag to show confirmation in next draw cycle
+            just_saved_to_gallery = True
+        elif _try_tile_move(event.pos) and board.solved:
+            on_puzzle_solved()
+    hud.handle_event(event)
+
+def handle_paused_event(event):
+    pause_menu.handle_event(event)
+    hud.handle_event(event)
+
+def handle_cropping_event(event):
+    if cropping_tool:
+        cropping_tool.handle_event(event)
+
+def update_cropping(dt):
+    if cropping_tool:
+        cropping_tool.update(dt)
+
+def draw_cropping(surf):
+    if cropping_tool:
+        cropping_tool.draw(surf)
+
+def draw_game_scene(surf):
+    """Background, board, HUD and (once solved) the completion overlay."""
+    global just_saved_to_gallery
+    if current_bg is not None:
+        surf.blit(current_bg, (0, 0))
+    else:
+        surf.fill(BG_COLOR)
+
+    board.draw(surf, TILE_FONT)
+    hud.draw(surf)
+
+    if board.solved:
+        # Draw completion overlay (one blits() call instead of a blit each)
+        surf.blits(((_SOLVED_OVERLAY, (0, 0)), (_SOLVED_SURF, _SOLVED_RECT)), False)
+        
+        # Text drawn over the button rects, batched into one blits() call
+        labels = []
+
+        # Draw save button if we have a cropped image and it's a custom puzzle
+        if show_save_button:
+            pygame.draw.rect(surf, (70, 120, 90), SAVE_BTN_RECT)
+            pygame.draw.rect(surf, (30, 60, 45), SAVE_BTN_RECT, 2)
+            labels.append((_SAVE_TEXT_SURF, _SAVE_TEXT_RECT))
+        
+        # Show confirmation message if just saved
+        if just_saved_to_gallery:
+            labels.append((_SAVED_MSG_SURF, _SAVED_MSG_RECT))
+            # Reset the flag after showing the message
+            just_saved_to_gallery = False
+
+        if labels:
+            surf.blits(labels, False)
+
+    star_hud.draw(surf)
+
+def draw_paused(surf):
+    draw_game_scene(surf)
+    pause_menu.draw(surf)
+
+# Custom-puzzle and gallery entries are added by their init_*_screen()
+EVENT_HANDLERS = {
+    STATE_MENU: menu.handle_event,
+    STATE_LEVEL_SELECT: level_select.handle_event,
+    STATE_SETTINGS: settings_screen.handle_event,
+    STATE_CROPPING: handle_cropping_event,
+    STATE_PLAYING: handle_playing_event,
+    STATE_PAUSED: handle_paused_event,
+}
+
+# Screens whose draw() covers the whole window (opaque background blit
+# or fill) – the main loop skips its BG_COLOR clear for these
+OPAQUE_STATES = {STATE_LEVEL_SELECT, STATE_GALLERY, STATE_PLAYING, STATE_PAUSED}
+
+# Gallery, playing and paused have no animations, so no update entry
+UPDATE_HANDLERS = {
+    STATE_MENU: menu.update,
+    STATE_LEVEL_SELECT: level_select.update,
+    STATE_SETTINGS: settings_screen.update,
+    STATE_CROPPING: update_cropping,
+}
+
+DRAW_HANDLERS = {
+    STATE_MENU: menu.draw,
+    STATE_LEVEL_SELECT: level_select.draw,
+    STATE_SETTINGS: settings_screen.draw,
+    STATE_CROPPING: draw_cropping,
+    STATE_PLAYING: draw_game_scene,
+    STATE_PAUSED: draw_paused,
+}
+
 # -----------------------------------------------------------------
 # Main loop
 # -----------------------------------------------------------------
+# States redrawn every frame; all other screens only change on input, so
+# they are re-rendered only when an event arrives (or during a fade).
+# The board has no tile animations, so playing and paused are idle too.
+LIVE_STATES = {STATE_CROPPING}
+IDLE_WAIT_MS = 250   # upper bound on how long an idle screen sleeps
+
+dirty = True     # set whenever the current frame must be re-rendered
+
 running = True
-while running:
-    # Calculate delta time for animations
-    dt = clock.tick(FPS)
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif game_state == STATE_MENU:
-            menu.handle_event(event)
-        elif game_state == STATE_LEVEL_SELECT:
-            level_select.handle_event(event)
-        elif game_state == STATE_SETTINGS:
-            settings_screen.handle_event(event)
-        elif game_state == STATE_CUSTOM_PUZZLE:
-            custom_puzzle_screen.handle_event(event)
-        elif game_state == STATE_CROPPING:
-            if cropping_tool:
-                cropping_tool.handle_event(event)
-        elif game_state == STATE_GALLERY:  # <-- NEW
-            gallery_screen.handle_event(event)
-        elif game_state == STATE_PLAYING:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Check if puzzle is solved and save button is clicked
-                cropped_image = board.get_cropped_image()
-                should_show_save = False
-                if cropped_image:
-                    # Check if this is a custom puzzle by checking if selected_level has custom_image
-                    if isinstance(selected_level, dict) and 'custom_image' in selected_level:
-                        should_show_save = True
-                    elif hasattr(selected_level, 'custom_image'):
-                        should_show_save = True
-                
-                if board.is_solved() and should_show_save:
-                    # Create save button rect to check collision
-                    save_btn_rect = pygame.Rect(
-                        WINDOW_SIZE[0]//2 - 100, 
-                        WINDOW_SIZE[1]//2 + 50, 
-                        200, 50
-                    )
-                    
-                    if save_btn_rect.collidepoint(event.pos):
-                        # Save to gallery
-                        rating = StarHUD.compute_rating(selected_level.rows, hud.move_count)
-                        gallery.save_memory(
-                            cropped_image, 
-                            selected_level["rows"] if isinstance(selected_level, dict) else selected_level.rows, 
-                            hud.move_count, 
-                            rating
-                        )
-                        # Set flag to show confirmation in next draw cycle
-                        # Since just_saved_to_gallery is already declared in the global scope,
-                        # we just need to set its value here
-                        just_saved_to_gallery = True
-                    else:
-                        # Store original empty position to compare later
-                        original_empty_pos = board.empty_pos
-                        
-                        # Process the click
-                        board.click_at(event.pos)
-                        
-                        # If the empty position changed, it means a tile was moved
-                        if board.empty_pos != original_empty_pos:
-                            # A valid move was made
-                            hud.increment_moves()
-                            play_move()
-                            play("place")
-                else:
-                    # Store original empty position to compare later
-                    original_empty_pos = board.empty_pos
-                    
-                    # Process the click
-                    board.click_at(event.pos)
-                    
-                    # If the empty position changed, it means a tile was moved
-                    if board.empty_pos != original_empty_pos:
-                        # A valid move was made
-                        hud.increment_moves()
-                        play_move()
-                        play("place")
-            hud.handle_event(event)
-        elif game_state == STATE_PAUSED:
-            pause_menu.handle_event(event)
-            hud.handle_event(event)
-
-    # Update UI components for animations
-    if game_state == STATE_MENU:
-        menu.update(dt)
-    elif game_state == STATE_LEVEL_SELECT:
-        level_select.update(dt)
-    elif game_state == STATE_SETTINGS:
-        settings_screen.update(dt)
-    elif game_state == STATE_CUSTOM_PUZZLE:
-        custom_puzzle_screen.update(dt)
-    elif game_state == STATE_CROPPING:
-        if cropping_tool:
-            cropping_tool.update(dt)
-    elif game_state == STATE_GALLERY:  # <-- NEW
-        # Gallery screen doesn't have animations, so no update needed
-        pass
-    elif game_state == STATE_PLAYING or game_state == STATE_PAUSED:
-        # Update HUD even when playing
-        pass  # HUD doesn't currently have animations
-
-    # Handle screen transitions
-    if in_transition:
-        elapsed = pygame.time.get_ticks() - transition_start_time
-        transition_progress = min(elapsed / transition_duration, 1.0)
+
+def main() -> None:
+    """Run the game loop until the window is closed, then save and exit."""
+    global running, dirty, transition_alpha
+    # Loop-invariant callables and constants bound once as fast locals.
+    # game_state/in_transition stay globals – callbacks reassign them.
+    tick = clock.tick
+    get_events = pygame.event.get
+    wait_event = pygame.event.wait
+    QUIT, NOEVENT = pygame.QUIT, pygame.NOEVENT
+    event_handlers = EVENT_HANDLERS      # lazy screens add entries in place
+    update_handlers = UPDATE_HANDLERS
+    draw_handlers = DRAW_HANDLERS
+    flip = pygame.display.flip
+    while running:
+        # Calculate delta time for animations
+        dt = tick(FPS)
+
+        if in_transition or game_state in LIVE_STATES:
+            events = get_events()
+        else:
+            # Nothing animating – sleep until input arrives instead of spinning
+            first = wait_event(IDLE_WAIT_MS)
+            events = get_events()
+            if first.type != NOEVENT:
+                events.insert(0, first)
+        if events:
+            dirty = True
+
+        for event in events:
+            if event.type == QUIT:
+                running = False
+                continue
+            # Looked up per event: a handler may switch game_state mid-batch
+            handler = event_handlers.get(game_state)
+            if handler:
+                handler(event)
+
+        # Update UI components for animations
+        updater = update_handlers.get(game_state)
+        if updater:
+            updater(dt)
+
+        # Handle screen transitions
+        if in_transition:
+            elapsed = (time.perf_counter() - transition_start_time) * 1000  # ms
+            transition_progress = min(elapsed / transition_duration, 1.0)
         
-        # Fade in: alpha goes from 0 to 255
-        transition_alpha = int(transition_progress * 255)
+            # Fade in: alpha goes from 0 to 255
+            transition_alpha = int(transition_progress * 255)
         
-        if transition_progress >= 1.0:
-            finish_transition()
-            apply_state_change()
-
-    # ------------------------------------------------------------
-    # Rendering
-    # ------------------------------------------------------------
-    screen.fill(BG_COLOR)
-
-    if game_state == STATE_MENU:
-        menu.draw(screen)
-    elif game_state == STATE_LEVEL_SELECT:
-        level_select.draw(screen)
-    elif game_state == STATE_SETTINGS:
-        settings_screen.draw(screen)
-    elif game_state == STATE_CUSTOM_PUZZLE:
-        custom_puzzle_screen.draw(screen)
-    elif game_state == STATE_CROPPING:
-        if cropping_tool:
-            cropping_tool.draw(screen)
-    elif game_state == STATE_GALLERY:  # <-- NEW
-        gallery_screen.draw(screen)
-    else:   # PLAYING or PAUSED
-        if selected_level:
-            try:
-                bg = pygame.image.load(str(selected_level.bg_path)).convert()
-                # Scale the background image to fit the entire screen
-                bg = pygame.transform.scale(bg, WINDOW_SIZE)
-                screen.blit(bg, (0, 0))
-            except Exception:
-                screen.fill(BG_COLOR)
-        else:
+            if transition_progress >= 1.0:
+                finish_transition()
+                apply_state_change()
+
+        flush_progress()
+
+        # ------------------------------------------------------------
+        # Rendering
+        # ------------------------------------------------------------
+        if not (dirty or in_transition or game_state in LIVE_STATES):
+            continue    # idle screen unchanged – keep the last frame up
+        dirty = False
+
+        # Screens that paint every pixel themselves don't need the clear
+        if game_state not in OPAQUE_STATES:
             screen.fill(BG_COLOR)
+        draw_handlers[game_state](screen)
+
+        # Draw transition overlay if in transition
+        if in_transition:
+            _TRANSITION_SURF.set_alpha(transition_alpha)
+            screen.blit(_TRANSITION_SURF, (0, 0))
+
+        # SCALED windows present the whole frame whatever rects are passed
+        # to display.update(), so every re-rendered frame is simply flipped
+        flip()
+
+    # Save progress before exiting (volume, mute, best moves, stars) –
+    # after any queued background writes, so this one lands last
+    _save_executor.shutdown(wait=True)
+    if gallery_screen:
+        gallery_screen.close()
+    save_progress(progress)
+    pygame.quit()
+    sys.exit()
 
-        board.draw(screen, pygame.font.SysFont(None, 48))
-        hud.draw(screen)
 
-        # Define save button rect here so both drawing and event handling can access it
-        save_btn_rect = pygame.Rect(
-            WINDOW_SIZE[0]//2 - 100, 
-            WINDOW_SIZE[1]//2 + 50, 
-            200, 50
-        )
-        
-        if board.is_solved():
-            rating = StarHUD.compute_rating(selected_level.rows, hud.move_count)
-            star_hud.set_rating(rating)
-
-            size_key = star_key(selected_level.rows)
-
-            # Best‑move logic
-            best_moves = progress.get("best_moves", {}).get(size_key)
-            if best_moves is None or hud.move_count < best_moves:
-                progress.setdefault("best_moves", {})[size_key] = hud.move_count
-
-            # Best‑star logic
-            best_star = progress.get("best_stars", {}).get(size_key, 0)
-            if rating > best_star:
-                progress.setdefault("best_stars", {})[size_key] = rating
-
-            play("complete")   # SFX for puzzle solved
-
-            # Get the cropped image for saving
-            cropped_image = board.get_cropped_image()
-            
-            # Draw completion overlay
-            overlay = pygame.Surface(WINDOW_SIZE, pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 120))
-            screen.blit(overlay, (0, 0))
-            
-            msg = pygame.font.SysFont(None, 72).render(
-                "Puzzle solved!", True, (255, 255, 255)
-            )
-            msg_rect = msg.get_rect(center=(WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2 - 50))
-            screen.blit(msg, msg_rect)
-            
-            # Draw save button if we have a cropped image and it's a custom puzzle
-            should_show_save = False
-            if cropped_image:
-                # Check if this is a custom puzzle by checking if selected_level has custom_image
-                if isinstance(selected_level, dict) and 'custom_image' in selected_level:
-                    should_show_save = True
-                elif hasattr(selected_level, 'custom_image'):
-                    should_show_save = True
-            
-            if should_show_save:
-                pygame.draw.rect(screen, (70, 120, 90), save_btn_rect)
-                pygame.draw.rect(screen, (30, 60, 45), save_btn_rect, 2)
-                save_text = pygame.font.SysFont(None, 36).render(
-                    "Save to Gallery", True, (255, 255, 255)
-                )
-                save_text_rect = save_text.get_rect(center=save_btn_rect.center)
-                screen.blit(save_text, save_text_rect)
-            
-            # Show confirmation message if just saved
-            if just_saved_to_gallery:
-                confirm_msg = pygame.font.SysFont(None, 36).render(
-                    "Saved to Gallery!", True, (100, 255, 100)
-                )
-                confirm_rect = confirm_msg.get_rect(center=(WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2 + 120))
-                screen.blit(confirm_msg, confirm_rect)
-                # Reset the flag after showing the message
-                just_saved_to_gallery = False
-
-        star_hud.draw(screen)
-
-        if game_state == STATE_PAUSED:
-            pause_menu.draw(screen)
-
-    # Draw transition overlay if in transition
-    if in_transition:
-        transition_overlay = pygame.Surface(WINDOW_SIZE, pygame.SRCALPHA)
-        transition_overlay.fill((0, 0, 0, transition_alpha))
-        screen.blit(transition_overlay, (0, 0))
-
-    pygame.display.flip()
-
-# ------------------------------------------------------------
-# Save progress before exiting (volume, mute, best moves, stars)
-# ------------------------------------------------------------
-save_progress(progress)
-pygame.quit()
-sys.exit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -50,27 +50,31 @@ class PauseMenu:
             r.y = start_y + idx * (btn_h + spacing)
             self.buttons.append((r, label, cb))
 
+        # Static layers, built once. The solid button shapes are drawn
+        # straight into the dim overlay; antialiased text is kept separate
+        # (blending it into an alpha layer would darken its edges) and
+        # goes out in one blits() call.
+        self._overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 150))
+        for rect, _, _ in self.buttons:
+            local = rect.move(-self.rect.left, -self.rect.top)
+            pygame.draw.rect(self._overlay, (70, 120, 90), local, border_radius=8)
+            pygame.draw.rect(self._overlay, (30, 60, 45), local, 2, border_radius=8)
+        title = self.font.render("Paused", True, (220, 220, 220))
+        self._text: list[tuple[pygame.Surface, pygame.Rect]] = [
+            (title, title.get_rect(center=(self.rect.centerx, self.rect.top + 80)))
+        ]
+        for rect, label, _ in self.buttons:
+            txt = self.font.render(label, True, (255, 255, 255))
+            self._text.append((txt, txt.get_rect(center=rect.center)))
+
     # -----------------------------------------------------------------
     # Rendering
     # -----------------------------------------------------------------
     def draw(self, surf: pygame.Surface) -> None:
-        # Dim the whole screen
-        overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        surf.blit(overlay, (0, 0))
-
-        # Title text
-        title = self.font.render("Paused", True, (220, 220, 220))
-        title_rect = title.get_rect(center=(self.rect.centerx, self.rect.top + 80))
-        surf.blit(title, title_rect)
-
-        # Buttons
-        for rect, label, _ in self.buttons:
-            pygame.draw.rect(surf, (70, 120, 90), rect, border_radius=8)
-            pygame.draw.rect(surf, (30, 60, 45), rect, 2, border_radius=8)
-            txt = self.font.render(label, True, (255, 255, 255))
-            txt_rect = txt.get_rect(center=rect.center)
-            surf.blit(txt, txt_rect)
+        # Dim the whole screen (button shapes included), then the text
+        surf.blit(self._overlay, self.rect.topleft)
+        surf.blits(self._text, False)
 
     # -----------------------------------------------------------------
     # Event handling
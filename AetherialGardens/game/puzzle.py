@@ -59,6 +59,8 @@ class Board:
         self.margin = margin
         self.tiles: List[List[Tile]] = []
         self.empty_pos = (rows - 1, cols - 1)
+        # Cached is_solved(), refreshed only when tiles actually move
+        self.solved = False
         self._create_tiles()
         if image_surface:
             self.apply_image(image_surface)   # texture the board
@@ -186,6 +188,7 @@ class Board:
                     if (r, c) in self._neighbors(*self.empty_pos):
                         self._swap((r, c), self.empty_pos)
                         self.empty_pos = (r, c)
+                        self.solved = self.is_solved()
                         return
 
     def shuffle(self, moves: int = 100) -> None:
@@ -196,6 +199,7 @@ class Board:
             target = random.choice(possible)
             self._swap(self.empty_pos, target)
             self.empty_pos = target
+        self.solved = self.is_solved()
 
     def is_solved(self) -> bool:
         """True when tiles are in sequential order with empty slot bottom‑right."""
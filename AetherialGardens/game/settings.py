@@ -45,24 +45,34 @@ class SettingsScreen:
         # Back button (bottom‑left)
         self.back_rect = pygame.Rect(10, screen_rect.height - 50, 80, 35)
 
+        # Static layers – the dim overlay and every label are built once;
+        # only the knob position and the mute caption vary between frames
+        self._overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 180))
+        title = self.title_font.render("Settings", True, (230, 230, 230))
+        vol_label = self.font.render("Volume", True, (200, 200, 200))
+        back_label = self.font.render("Back", True, (255, 255, 255))
+        self._labels: list[tuple[pygame.Surface, pygame.Rect]] = [
+            (title, title.get_rect(center=(self.rect.centerx, self.rect.top + 70))),
+            (vol_label, vol_label.get_rect(
+                midright=(self.slider_rect.left - 10, self.slider_rect.centery))),
+        ]
+        self._back_label = (back_label, back_label.get_rect(center=self.back_rect.center))
+        # Mute caption per state: muted → "Un‑mute", else "Mute"
+        self._mute_labels: dict[bool, tuple[pygame.Surface, pygame.Rect]] = {}
+        for muted, text in ((True, "Un‑mute"), (False, "Mute")):
+            label = self.font.render(text, True, (255, 255, 255))
+            self._mute_labels[muted] = (label, label.get_rect(center=self.mute_rect.center))
+
     # -----------------------------------------------------------------
     # Rendering
     # -----------------------------------------------------------------
     def draw(self, surf: pygame.Surface) -> None:
         # Dim the whole screen
-        overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surf.blit(overlay, (0, 0))
+        surf.blit(self._overlay, (0, 0))
 
-        # Title
-        title = self.title_font.render("Settings", True, (230, 230, 230))
-        title_rect = title.get_rect(center=(self.rect.centerx, self.rect.top + 70))
-        surf.blit(title, title_rect)
-
-        # Volume label
-        vol_label = self.font.render("Volume", True, (200, 200, 200))
-        vol_rect = vol_label.get_rect(midright=(self.slider_rect.left - 10, self.slider_rect.centery))
-        surf.blit(vol_label, vol_rect)
+        # Title and volume label
+        surf.blits(self._labels, False)
 
         # Slider line
         pygame.draw.rect(surf, (150, 150, 150), self.slider_rect, border_radius=4)
@@ -75,19 +85,14 @@ class SettingsScreen:
         pygame.draw.circle(surf, (30, 30, 30), knob_center, self.knob_radius, 2)
 
         # Mute button
-        mute_txt = "Un‑mute" if self.get_muted() else "Mute"
         pygame.draw.rect(surf, (80, 80, 120), self.mute_rect, border_radius=5)
         pygame.draw.rect(surf, (30, 30, 60), self.mute_rect, 2, border_radius=5)
-        mute_label = self.font.render(mute_txt, True, (255, 255, 255))
-        mute_label_rect = mute_label.get_rect(center=self.mute_rect.center)
-        surf.blit(mute_label, mute_label_rect)
+        surf.blit(*self._mute_labels[bool(self.get_muted())])
 
         # Back button
         pygame.draw.rect(surf, (70, 90, 70), self.back_rect, border_radius=5)
         pygame.draw.rect(surf, (30, 50, 30), self.back_rect, 2, border_radius=5)
-        back_label = self.font.render("Back", True, (255, 255, 255))
-        back_rect = back_label.get_rect(center=self.back_rect.center)
-        surf.blit(back_label, back_rect)
+        surf.blit(*self._back_label)
 
     # -----------------------------------------------------------------
     # Event handling
@@ -42,6 +42,8 @@ class StarHUD:
         self.screen_rect = screen_rect
         self.rating = 0          # 0‑3
         self.font = pygame.font.SysFont(None, 24)
+        # "n/3" labels, rendered once per distinct rating
+        self._rating_msg_cache: dict[int, pygame.Surface] = {}
 
     def set_rating(self, rating: int) -> None:
         """Clamp rating to 0‑3 and store it."""
@@ -66,7 +68,10 @@ class StarHUD:
             pygame.draw.polygon(surf, gold, points)
 
         # Show the numeric value next to the stars (optional)
-        txt = self.font.render(f"{self.rating}/3", True, (230, 230, 230))
+        txt = self._rating_msg_cache.get(self.rating)
+        if txt is None:
+            txt = self.font.render(f"{self.rating}/3", True, (230, 230, 230))
+            self._rating_msg_cache[self.rating] = txt
         txt_rect = txt.get_rect(midleft=(start_x + total_width + 8, y + star_radius))
         surf.blit(txt, txt_rect)
 
@@ -7,7 +7,7 @@ import pygame
 from typing import Callable, Tuple
 
 # Import the audio system for UI sounds
-from .audio import play
+from .audio import play_id, SFX
 
 # ------------------------------------------------------------
 # Button – rectangular clickable UI element with animations.
@@ -71,7 +71,7 @@ class Button:
             
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
-                play('confirm')  # Play confirm sound
+                play_id(SFX.CONFIRM)  # Play confirm sound
                 self.is_pressed = True
                 self.callback()
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -82,7 +82,7 @@ class Button:
             self.is_hovered = self.rect.collidepoint(event.pos)
             # Play hover sound only when entering the button area
             if self.is_hovered and not was_hovered:
-                play('hover')
+                play_id(SFX.HOVER)
 
     def update(self, dt: float) -> None:
         """Update animations based on time delta."""
@@ -191,6 +191,12 @@ class HUD:
         self.pause_rect = pygame.Rect(screen_rect.right - size - 10, 10, size, size)
         self.font = pygame.font.SysFont(None, 36)
         self.counter_font = pygame.font.SysFont(None, 28)
+        # The pause symbol never changes; the counter text only when a move is made
+        self._pause_sym = self.font.render("II", True, (255, 255, 255))
+        self._pause_sym_rect = self._pause_sym.get_rect(center=self.pause_rect.center)
+        self._counter_surf = None
+        self._counter_rect = None
+        self._counter_value = None
 
     def increment_moves(self) -> None:
         self.move_count += 1
@@ -199,16 +205,16 @@ class HUD:
         # Move counter with background box (keeping the improvement)
         pygame.draw.rect(surf, (30, 60, 45, 180), self.counter_rect, border_radius=8)
         pygame.draw.rect(surf, (50, 90, 70), self.counter_rect, 2, border_radius=8)
-        counter = self.counter_font.render(f"Moves: {self.move_count}", True, (240, 240, 240))
-        counter_rect = counter.get_rect(center=self.counter_rect.center)
-        surf.blit(counter, counter_rect)
+        if self._counter_value != self.move_count:
+            self._counter_surf = self.counter_font.render(f"Moves: {self.move_count}", True, (240, 240, 240))
+            self._counter_rect = self._counter_surf.get_rect(center=self.counter_rect.center)
+            self._counter_value = self.move_count
+        surf.blit(self._counter_surf, self._counter_rect)
         
         # Pause button (simple II symbol - back to original style)
         pygame.draw.rect(surf, (80, 100, 80), self.pause_rect, border_radius=5)
         pygame.draw.rect(surf, (30, 50, 30), self.pause_rect, 2, border_radius=5)
-        pause_sym = self.font.render("II", True, (255, 255, 255))
-        sym_rect = pause_sym.get_rect(center=self.pause_rect.center)
-        surf.blit(pause_sym, sym_rect)
+        surf.blit(self._pause_sym, self._pause_sym_rect)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: